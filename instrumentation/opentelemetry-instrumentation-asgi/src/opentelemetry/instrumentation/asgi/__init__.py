@@ -20,7 +20,6 @@ timing through OpenTelemetry.
 
 import typing
 import urllib
-from functools import wraps
 from typing import Tuple
 
 from asgiref.compatibility import guarantee_single_callable
@@ -33,6 +32,13 @@ from opentelemetry.propagators.textmap import Getter
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.trace.status import Status, StatusCode
 
+# Status instances are immutable, share one per status code between spans
+_STATUSES = {status_code: Status(status_code) for status_code in StatusCode}
+
+# header names already converted to the lower case bytes used by asgi
+_HEADER_KEYS = {}
+_HEADER_KEYS_MAXSIZE = 256
+
 
 class ASGIGetter(Getter):
     def get(
@@ -48,16 +54,22 @@ class ASGIGetter(Getter):
             A list with a single string with the header value if it exists,
                 else None.
         """
+        # asgi header keys are in lower case, compare them as bytes so
+        # only the matching values need to be decoded
+        header_key = _HEADER_KEYS.get(key)
+        if header_key is None:
+            header_key = key.lower().encode("utf8")
+            if len(_HEADER_KEYS) < _HEADER_KEYS_MAXSIZE:
+                _HEADER_KEYS[key] = header_key
+
         headers = carrier.get("headers")
         if not headers:
             return None
 
-        # asgi header keys are in lower case
-        key = key.lower()
         decoded = [
             _value.decode("utf8")
             for (_key, _value) in headers
-            if _key.decode("utf8") == key
+            if _key == header_key
         ]
         if not decoded:
             return None
@@ -70,24 +82,43 @@ class ASGIGetter(Getter):
 asgi_getter = ASGIGetter()
 
 
-def collect_request_attributes(scope):
+def collect_request_attributes(scope, host_port_url=None):
     """Collects HTTP request attributes from the ASGI scope and returns a
-    dictionary to be used as span creation attributes."""
-    server_host, port, http_url = get_host_port_url_tuple(scope)
+    dictionary to be used as span creation attributes.
+
+    Args:
+        scope: the asgi scope dictionary
+        host_port_url: the (host, port, full_url) tuple for scope, as
+            returned by get_host_port_url_tuple, if already computed.
+    """
+    if host_port_url is None:
+        host_port_url = get_host_port_url_tuple(scope)
+    server_host, port, http_url = host_port_url
     query_string = scope.get("query_string")
     if query_string and http_url:
         if isinstance(query_string, bytes):
             query_string = query_string.decode("utf8")
-        http_url = http_url + ("?" + urllib.parse.unquote(query_string))
+        if "%" in query_string:
+            query_string = urllib.parse.unquote(query_string)
+        http_url = http_url + "?" + query_string
 
     result = {
-        SpanAttributes.HTTP_SCHEME: scope.get("scheme"),
         SpanAttributes.HTTP_HOST: server_host,
-        SpanAttributes.NET_HOST_PORT: port,
-        SpanAttributes.HTTP_FLAVOR: scope.get("http_version"),
-        SpanAttributes.HTTP_TARGET: scope.get("path"),
         SpanAttributes.HTTP_URL: http_url,
     }
+    # only set the attributes present in the scope, None is not a valid
+    # attribute value
+    if port is not None:
+        result[SpanAttributes.NET_HOST_PORT] = port
+    scheme = scope.get("scheme")
+    if scheme is not None:
+        result[SpanAttributes.HTTP_SCHEME] = scheme
+    http_version = scope.get("http_version")
+    if http_version is not None:
+        result[SpanAttributes.HTTP_FLAVOR] = http_version
+    path = scope.get("path")
+    if path is not None:
+        result[SpanAttributes.HTTP_TARGET] = path
     http_method = scope.get("method")
     if http_method:
         result[SpanAttributes.HTTP_METHOD] = http_method
@@ -101,12 +132,12 @@ def collect_request_attributes(scope):
     if http_user_agent:
         result[SpanAttributes.HTTP_USER_AGENT] = http_user_agent[0]
 
-    if "client" in scope and scope["client"] is not None:
-        result[SpanAttributes.NET_PEER_IP] = scope.get("client")[0]
-        result[SpanAttributes.NET_PEER_PORT] = scope.get("client")[1]
-
-    # remove None values
-    result = {k: v for k, v in result.items() if v is not None}
+    client = scope.get("client")
+    if client is not None:
+        if client[0] is not None:
+            result[SpanAttributes.NET_PEER_IP] = client[0]
+        if client[1] is not None:
+            result[SpanAttributes.NET_PEER_PORT] = client[1]
 
     return result
 
@@ -116,9 +147,16 @@ def get_host_port_url_tuple(scope):
     """
     server = scope.get("server") or ["0.0.0.0", 80]
     port = server[1]
-    server_host = server[0] + (":" + str(port) if port != 80 else "")
-    full_path = scope.get("root_path", "") + scope.get("path", "")
-    http_url = scope.get("scheme", "http") + "://" + server_host + full_path
+    server_host = server[0] if port == 80 else server[0] + ":" + str(port)
+    http_url = "".join(
+        (
+            scope.get("scheme", "http"),
+            "://",
+            server_host,
+            scope.get("root_path", ""),
+            scope.get("path", ""),
+        )
+    )
     return server_host, port, http_url
 
 
@@ -126,18 +164,20 @@ def set_status_code(span, status_code):
     """Adds HTTP response attributes to span using the status_code argument."""
     if not span.is_recording():
         return
-    try:
-        status_code = int(status_code)
-    except ValueError:
-        span.set_status(
-            Status(
-                StatusCode.ERROR,
-                "Non-integer HTTP status: " + repr(status_code),
+    # the asgi spec requires an int status, only convert anything else
+    if not isinstance(status_code, int):
+        try:
+            status_code = int(status_code)
+        except ValueError:
+            span.set_status(
+                Status(
+                    StatusCode.ERROR,
+                    "Non-integer HTTP status: " + repr(status_code),
+                )
             )
-        )
-    else:
-        span.set_attribute(SpanAttributes.HTTP_STATUS_CODE, status_code)
-        span.set_status(Status(http_status_to_status_code(status_code)))
+            return
+    span.set_attribute(SpanAttributes.HTTP_STATUS_CODE, status_code)
+    span.set_status(_STATUSES[http_status_to_status_code(status_code)])
 
 
 def get_default_span_details(scope: dict) -> Tuple[str, dict]:
@@ -169,6 +209,10 @@ class OpenTelemetryMiddleware:
             Optional: Defaults to get_default_span_details.
         tracer_provider: The optional tracer provider to use. If omitted
             the current globally configured one is used.
+        sampling_predicate: Optional callable taking the asgi scope and
+            returning whether the request should be traced. It runs before
+            context extraction, so requests it rejects are forwarded to the
+            application without any tracing overhead.
     """
 
     def __init__(
@@ -177,6 +221,7 @@ class OpenTelemetryMiddleware:
         excluded_urls=None,
         span_details_callback=None,
         tracer_provider=None,
+        sampling_predicate=None,
     ):
         self.app = guarantee_single_callable(app)
         self.tracer = trace.get_tracer(__name__, __version__, tracer_provider)
@@ -184,6 +229,7 @@ class OpenTelemetryMiddleware:
             span_details_callback or get_default_span_details
         )
         self.excluded_urls = excluded_urls
+        self.sampling_predicate = sampling_predicate
 
     async def __call__(self, scope, receive, send):
         """The ASGI application
@@ -193,52 +239,77 @@ class OpenTelemetryMiddleware:
             receive: An awaitable callable yielding dictionaries
             send: An awaitable callable taking a single dictionary as argument.
         """
-        if scope["type"] not in ("http", "websocket"):
+        scope_type = scope["type"]
+        if scope_type not in ("http", "websocket"):
             return await self.app(scope, receive, send)
 
-        _, _, url = get_host_port_url_tuple(scope)
-        if self.excluded_urls and self.excluded_urls.url_disabled(url):
+        host_port_url = None
+        if self.excluded_urls:
+            host_port_url = get_host_port_url_tuple(scope)
+            if self.excluded_urls.url_disabled(host_port_url[2]):
+                return await self.app(scope, receive, send)
+
+        if self.sampling_predicate and not self.sampling_predicate(scope):
             return await self.app(scope, receive, send)
 
-        token = context.attach(extract(scope, getter=asgi_getter))
+        ctx = extract(scope, getter=asgi_getter)
+        # nothing to attach when no context was propagated and none is
+        # current, as is the case for most incoming requests
+        token = context.attach(ctx) if ctx or context.get_current() else None
         span_name, additional_attributes = self.span_details_callback(scope)
 
+        # bound once, the wrappers below start a span for every message
+        start_as_current_span = self.tracer.start_as_current_span
+
         try:
-            with self.tracer.start_as_current_span(
-                span_name + " asgi", kind=trace.SpanKind.SERVER,
+            # passed when starting the span, so that samplers and span
+            # processors see them
+            attributes = collect_request_attributes(scope, host_port_url)
+            if additional_attributes:
+                attributes.update(additional_attributes)
+
+            with start_as_current_span(
+                span_name + " asgi",
+                kind=trace.SpanKind.SERVER,
+                attributes=attributes,
             ) as span:
                 if span.is_recording():
-                    attributes = collect_request_attributes(scope)
-                    attributes.update(additional_attributes)
-                    for key, value in attributes.items():
-                        span.set_attribute(key, value)
-
-                @wraps(receive)
-                async def wrapped_receive():
-                    with self.tracer.start_as_current_span(
-                        span_name + " asgi." + scope["type"] + ".receive"
-                    ) as receive_span:
-                        message = await receive()
-                        if receive_span.is_recording():
-                            if message["type"] == "websocket.receive":
-                                set_status_code(receive_span, 200)
-                            receive_span.set_attribute("type", message["type"])
-                    return message
-
-                @wraps(send)
-                async def wrapped_send(message):
-                    with self.tracer.start_as_current_span(
-                        span_name + " asgi." + scope["type"] + ".send"
-                    ) as send_span:
-                        if send_span.is_recording():
-                            if message["type"] == "http.response.start":
-                                status_code = message["status"]
-                                set_status_code(send_span, status_code)
-                            elif message["type"] == "websocket.send":
-                                set_status_code(send_span, 200)
-                            send_span.set_attribute("type", message["type"])
-                        await send(message)
-
-                await self.app(scope, wrapped_receive, wrapped_send)
+                    message_span_name = span_name + " asgi." + scope_type
+                    receive_span_name = message_span_name + ".receive"
+                    send_span_name = message_span_name + ".send"
+
+                    async def wrapped_receive():
+                        with start_as_current_span(
+                            receive_span_name
+                        ) as receive_span:
+                            message = await receive()
+                            if receive_span.is_recording():
+                                message_type = message["type"]
+                                if message_type == "websocket.receive":
+                                    set_status_code(receive_span, 200)
+                                receive_span.set_attribute(
+                                    "type", message_type
+                                )
+                        return message
+
+                    async def wrapped_send(message):
+                        with start_as_current_span(
+                            send_span_name
+                        ) as send_span:
+                            if send_span.is_recording():
+                                message_type = message["type"]
+                                if message_type == "http.response.start":
+                                    status_code = message["status"]
+                                    set_status_code(send_span, status_code)
+                                elif message_type == "websocket.send":
+                                    set_status_code(send_span, 200)
+                                send_span.set_attribute("type", message_type)
+                            await send(message)
+
+                    await self.app(scope, wrapped_receive, wrapped_send)
+                else:
+                    # the receive/send spans would not be recorded either
+                    await self.app(scope, receive, send)
         finally:
-            context.detach(token)
+            if token is not None:
+                context.detach(token)
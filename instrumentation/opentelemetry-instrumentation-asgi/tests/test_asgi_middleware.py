@@ -171,8 +171,8 @@ class TestAsgiApplication(AsgiTestBase):
         mock_span = mock.Mock()
         mock_span.is_recording.return_value = False
         mock_tracer.start_as_current_span.return_value = mock_span
-        mock_tracer.start_as_current_span.return_value.__enter__ = mock_span
-        mock_tracer.start_as_current_span.return_value.__exit__ = mock_span
+        mock_span.__enter__ = mock.Mock(return_value=mock_span)
+        mock_span.__exit__ = mock.Mock(return_value=False)
         with mock.patch("opentelemetry.trace.get_tracer") as tracer:
             tracer.return_value = mock_tracer
             app = otel_asgi.OpenTelemetryMiddleware(simple_asgi)
@@ -180,7 +180,10 @@ class TestAsgiApplication(AsgiTestBase):
             self.send_default_request()
             self.assertFalse(mock_span.is_recording())
             self.assertTrue(mock_span.is_recording.called)
+            # no receive/send spans are started for a non-recording span
+            self.assertEqual(mock_tracer.start_as_current_span.call_count, 1)
             self.assertFalse(mock_span.set_attribute.called)
+            self.assertFalse(mock_span.set_attributes.called)
             self.assertFalse(mock_span.set_status.called)
 
     def test_asgi_exc_info(self):
@@ -321,6 +324,26 @@ class TestAsgiApplication(AsgiTestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 0)
 
+    def test_sampling_predicate(self):
+        app = otel_asgi.OpenTelemetryMiddleware(
+            simple_asgi, sampling_predicate=lambda scope: False
+        )
+        self.seed_app(app)
+        self.send_default_request()
+        outputs = self.get_all_output()
+        self.assertEqual(len(outputs), 2)
+        span_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(span_list), 0)
+
+    def test_sampling_predicate_accepts(self):
+        app = otel_asgi.OpenTelemetryMiddleware(
+            simple_asgi, sampling_predicate=lambda scope: True
+        )
+        self.seed_app(app)
+        self.send_default_request()
+        outputs = self.get_all_output()
+        self.validate_outputs(outputs)
+
 
 class TestAsgiAttributes(unittest.TestCase):
     def setUp(self):
@@ -352,6 +375,12 @@ class TestAsgiAttributes(unittest.TestCase):
             },
         )
 
+    def test_request_attributes_client_without_port(self):
+        self.scope["client"] = ["/tmp/server.sock", None]
+        attrs = otel_asgi.collect_request_attributes(self.scope)
+        self.assertEqual(attrs[SpanAttributes.NET_PEER_IP], "/tmp/server.sock")
+        self.assertNotIn(SpanAttributes.NET_PEER_PORT, attrs)
+
     def test_query_string(self):
         self.scope["query_string"] = b"foo=bar"
         attrs = otel_asgi.collect_request_attributes(self.scope)
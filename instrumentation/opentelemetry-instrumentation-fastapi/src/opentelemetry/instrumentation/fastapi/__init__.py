@@ -18,7 +18,11 @@ from starlette.routing import Match
 from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.semconv.trace import SpanAttributes
-from opentelemetry.util.http import get_excluded_urls
+from opentelemetry.util.http import (
+    ExcludeList,
+    get_excluded_urls,
+    parse_excluded_urls,
+)
 
 _excluded_urls = get_excluded_urls("FASTAPI")
 
@@ -32,13 +36,30 @@ class FastAPIInstrumentor(BaseInstrumentor):
     _original_fastapi = None
 
     @staticmethod
-    def instrument_app(app: fastapi.FastAPI, tracer_provider=None):
+    def instrument_app(
+        app: fastapi.FastAPI, tracer_provider=None, excluded_urls=None
+    ):
         """Instrument an uninstrumented FastAPI application.
+
+        Args:
+            app: The FastAPI application to instrument.
+            tracer_provider: The optional tracer provider to use.
+            excluded_urls: Optional comma separated string, or sequence, of
+                url regexes to exclude from tracing. Defaults to the value of
+                the ``OTEL_PYTHON_FASTAPI_EXCLUDED_URLS`` environment
+                variable.
         """
+        if excluded_urls is None:
+            excluded_urls = _excluded_urls
+        elif isinstance(excluded_urls, str):
+            excluded_urls = parse_excluded_urls(excluded_urls)
+        else:
+            excluded_urls = ExcludeList(list(excluded_urls))
+
         if not getattr(app, "is_instrumented_by_opentelemetry", False):
             app.add_middleware(
                 OpenTelemetryMiddleware,
-                excluded_urls=_excluded_urls,
+                excluded_urls=excluded_urls,
                 span_details_callback=_get_route_details,
                 tracer_provider=tracer_provider,
             )
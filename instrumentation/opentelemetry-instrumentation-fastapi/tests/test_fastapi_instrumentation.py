@@ -19,6 +19,7 @@ import fastapi
 from fastapi.testclient import TestClient
 
 import opentelemetry.instrumentation.fastapi as otel_fastapi
+from opentelemetry.propagate import extract
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.test.test_base import TestBase
@@ -84,6 +85,20 @@ class TestFastAPIManualInstrumentation(TestBase):
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
 
+    def test_fastapi_excluded_urls_skip_context_extraction(self):
+        """Ensure that excluded urls bypass trace context propagation."""
+        with patch(
+            "opentelemetry.instrumentation.asgi.extract", wraps=extract
+        ) as mock_extract:
+            self._client.get("/healthzz")
+            mock_extract.assert_not_called()
+            self._client.get("/foobar")
+            mock_extract.assert_called_once()
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 3)
+        # the server span is a root span of the real, empty, context
+        self.assertIsNone(spans[-1].parent)
+
     @staticmethod
     def _create_fastapi_app():
         app = fastapi.FastAPI()
@@ -107,6 +122,27 @@ class TestFastAPIManualInstrumentation(TestBase):
         return app
 
 
+class TestFastAPIManualInstrumentationExplicitExcludedUrls(TestBase):
+    def test_fastapi_explicit_excluded_urls(self):
+        """Ensure that excluded urls passed to instrument_app are used,
+        either as a comma separated string or as a sequence."""
+        for excluded_urls in ("/user/123,foobar", ["/user/123", "foobar"]):
+            with self.subTest(excluded_urls=excluded_urls):
+                self.memory_exporter.clear()
+                app = TestFastAPIManualInstrumentation._create_fastapi_app()
+                otel_fastapi.FastAPIInstrumentor.instrument_app(
+                    app, excluded_urls=excluded_urls
+                )
+                client = TestClient(app)
+                client.get("/user/123")
+                client.get("/foobar")
+                spans = self.memory_exporter.get_finished_spans()
+                self.assertEqual(len(spans), 0)
+                client.get("/exclude/123")
+                spans = self.memory_exporter.get_finished_spans()
+                self.assertEqual(len(spans), 3)
+
+
 class TestAutoInstrumentation(TestFastAPIManualInstrumentation):
     """Test the auto-instrumented variant
 
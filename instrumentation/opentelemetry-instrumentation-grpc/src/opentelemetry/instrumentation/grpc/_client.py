@@ -19,8 +19,7 @@
 
 """Implementation of the invocation-side open-telemetry interceptor."""
 
-from collections import OrderedDict
-from typing import MutableMapping
+from typing import MutableSequence, Tuple
 
 import grpc
 
@@ -56,16 +55,40 @@ class _GuardedSpan:
 
 class _CarrierSetter(Setter):
     """We use a custom setter in order to be able to lower case
-    keys as is required by grpc.
+    keys as is required by grpc. Entries are appended to a list of
+    pairs so no intermediate mapping is built per call.
     """
 
-    def set(self, carrier: MutableMapping[str, str], key: str, value: str):
-        carrier[key.lower()] = value
+    def set(
+        self, carrier: MutableSequence[Tuple[str, str]], key: str, value: str,
+    ):
+        carrier.append((key.lower(), value))
 
 
 _carrier_setter = _CarrierSetter()
 
 
+def _inject_metadata(metadata):
+    """Returns metadata with the current context injected into it. Entries
+    of the caller for the injected keys are replaced rather than sent
+    twice."""
+    injected = []
+    inject(injected, setter=_carrier_setter)
+    if not metadata:
+        return tuple(injected)
+    if not injected:
+        return tuple(metadata)
+    injected_keys = {key for key, _ in injected}
+    return tuple(
+        [
+            (key, value)
+            for key, value in metadata
+            if key.lower() not in injected_keys
+        ]
+        + injected
+    )
+
+
 def _make_future_done_callback(span, rpc_info):
     def callback(response_future):
         with span:
@@ -122,14 +145,8 @@ class OpenTelemetryClientInterceptor(
         return _GuardedSpan(self._start_span(*args, **kwargs))
 
     def intercept_unary(self, request, metadata, client_info, invoker):
-        if not metadata:
-            mutable_metadata = OrderedDict()
-        else:
-            mutable_metadata = OrderedDict(metadata)
-
         with self._start_guarded_span(client_info.full_method) as guarded_span:
-            inject(mutable_metadata, setter=_carrier_setter)
-            metadata = tuple(mutable_metadata.items())
+            metadata = _inject_metadata(metadata)
 
             rpc_info = RpcInfo(
                 full_method=client_info.full_method,
@@ -157,14 +174,8 @@ class OpenTelemetryClientInterceptor(
     def _intercept_server_stream(
         self, request_or_iterator, metadata, client_info, invoker
     ):
-        if not metadata:
-            mutable_metadata = OrderedDict()
-        else:
-            mutable_metadata = OrderedDict(metadata)
-
         with self._start_span(client_info.full_method) as span:
-            inject(mutable_metadata, setter=_carrier_setter)
-            metadata = tuple(mutable_metadata.items())
+            metadata = _inject_metadata(metadata)
             rpc_info = RpcInfo(
                 full_method=client_info.full_method,
                 metadata=metadata,
@@ -194,14 +205,8 @@ class OpenTelemetryClientInterceptor(
                 request_or_iterator, metadata, client_info, invoker
             )
 
-        if not metadata:
-            mutable_metadata = OrderedDict()
-        else:
-            mutable_metadata = OrderedDict(metadata)
-
         with self._start_guarded_span(client_info.full_method) as guarded_span:
-            inject(mutable_metadata, setter=_carrier_setter)
-            metadata = tuple(mutable_metadata.items())
+            metadata = _inject_metadata(metadata)
             rpc_info = RpcInfo(
                 full_method=client_info.full_method,
                 metadata=metadata,
@@ -26,10 +26,15 @@ from opentelemetry.instrumentation.grpc._client import (
 from opentelemetry.instrumentation.grpc.grpcext._interceptor import (
     _UnaryClientInfo,
 )
+from opentelemetry.baggage.propagation import W3CBaggagePropagator
 from opentelemetry.propagate import get_global_textmap, set_global_textmap
+from opentelemetry.propagators.composite import CompositePropagator
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.test.mock_textmap import MockTextMapPropagator
 from opentelemetry.test.test_base import TestBase
+from opentelemetry.trace.propagation.tracecontext import (
+    TraceContextTextMapPropagator,
+)
 
 from ._client import (
     bidirectional_streaming_method,
@@ -83,22 +88,26 @@ class Interceptor(
 
 
 class TestClientProto(TestBase):
-    def setUp(self):
-        super().setUp()
+    # The server, channel and stub are shared by every test in the class;
+    # TestBase.setUp clears the memory exporter before each test.
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
         GrpcInstrumentorClient().instrument()
-        self.server = create_test_server(25565)
-        self.server.start()
+        cls.server = create_test_server(25565)
+        cls.server.start()
         # use a user defined interceptor along with the opentelemetry client interceptor
         interceptors = [Interceptor()]
-        self.channel = grpc.insecure_channel("localhost:25565")
-        self.channel = grpc.intercept_channel(self.channel, *interceptors)
-        self._stub = test_server_pb2_grpc.GRPCTestServerStub(self.channel)
+        cls.channel = grpc.insecure_channel("localhost:25565")
+        cls.channel = grpc.intercept_channel(cls.channel, *interceptors)
+        cls._stub = test_server_pb2_grpc.GRPCTestServerStub(cls.channel)
 
-    def tearDown(self):
-        super().tearDown()
+    @classmethod
+    def tearDownClass(cls):
         GrpcInstrumentorClient().uninstrument()
-        self.server.stop(None)
-        self.channel.close()
+        cls.server.stop(None)
+        cls.channel.close()
+        super().tearDownClass()
 
     def test_unary_unary(self):
         simple_method(self._stub)
@@ -286,3 +295,93 @@ class TestClientProto(TestBase):
 
         finally:
             set_global_textmap(previous_propagator)
+
+    def test_client_interceptor_replaces_propagated_metadata(
+        self,
+    ):  # pylint: disable=no-self-use
+        """ensure that client interceptor replaces trace context already present in the outgoing metadata."""
+        previous_propagator = get_global_textmap()
+        try:
+            set_global_textmap(MockTextMapPropagator())
+            interceptor = OpenTelemetryClientInterceptor(
+                trace._DefaultTracer()
+            )
+
+            carrier = tuple()
+
+            def invoker(request, metadata):
+                nonlocal carrier
+                carrier = metadata
+                return {}
+
+            request = Request(client_id=1, request_data="data")
+            interceptor.intercept_unary(
+                request,
+                (("mock-traceid", "stale"), ("key", "value")),
+                _UnaryClientInfo(
+                    full_method="/GRPCTestServer/SimpleMethod", timeout=None
+                ),
+                invoker=invoker,
+            )
+
+            assert carrier == (
+                ("key", "value"),
+                ("mock-traceid", "0"),
+                ("mock-spanid", "0"),
+            )
+
+        finally:
+            set_global_textmap(previous_propagator)
+
+    def test_client_interceptor_keeps_metadata_not_injected(self):
+        """ensure that client interceptor keeps the propagated fields of the outgoing metadata it does not inject."""
+        previous_propagator = get_global_textmap()
+        try:
+            set_global_textmap(
+                CompositePropagator(
+                    [TraceContextTextMapPropagator(), W3CBaggagePropagator()]
+                )
+            )
+            interceptor = OpenTelemetryClientInterceptor(
+                self.tracer_provider.get_tracer(__name__)
+            )
+
+            carrier = tuple()
+
+            def invoker(request, metadata):
+                nonlocal carrier
+                carrier = metadata
+                return {}
+
+            stale_traceparent = (
+                "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+            )
+            request = Request(client_id=1, request_data="data")
+            interceptor.intercept_unary(
+                request,
+                (
+                    ("baggage", "user=1"),
+                    ("tracestate", "vendor=x"),
+                    ("traceparent", stale_traceparent),
+                    ("key", "value"),
+                ),
+                _UnaryClientInfo(
+                    full_method="/GRPCTestServer/SimpleMethod", timeout=None
+                ),
+                invoker=invoker,
+            )
+
+            self.assertEqual(
+                carrier[:3],
+                (
+                    ("baggage", "user=1"),
+                    ("tracestate", "vendor=x"),
+                    ("key", "value"),
+                ),
+            )
+            self.assertEqual(len(carrier), 4)
+            self.assertEqual(carrier[3][0], "traceparent")
+            self.assertNotEqual(carrier[3][1], stale_traceparent)
+
+        finally:
+            set_global_textmap(previous_propagator)
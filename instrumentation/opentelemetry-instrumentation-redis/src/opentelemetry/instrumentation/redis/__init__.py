@@ -58,15 +58,6 @@ from opentelemetry.semconv.trace import SpanAttributes
 _DEFAULT_SERVICE = "redis"
 
 
-def _set_connection_attributes(span, conn):
-    if not span.is_recording():
-        return
-    for key, value in _extract_conn_attributes(
-        conn.connection_pool.connection_kwargs
-    ).items():
-        span.set_attribute(key, value)
-
-
 def _traced_execute_command(func, instance, args, kwargs):
     tracer = getattr(redis, "_opentelemetry_tracer")
     query = _format_command_args(args)
@@ -79,9 +70,12 @@ def _traced_execute_command(func, instance, args, kwargs):
         name, kind=trace.SpanKind.CLIENT
     ) as span:
         if span.is_recording():
-            span.set_attribute(SpanAttributes.DB_STATEMENT, query)
-            _set_connection_attributes(span, instance)
-            span.set_attribute("db.redis.args_length", len(args))
+            attributes = _extract_conn_attributes(
+                instance.connection_pool.connection_kwargs
+            )
+            attributes[SpanAttributes.DB_STATEMENT] = query
+            attributes["db.redis.args_length"] = len(args)
+            span.set_attributes(attributes)
         return func(*args, **kwargs)
 
 
@@ -97,11 +91,14 @@ def _traced_execute_pipeline(func, instance, args, kwargs):
         span_name, kind=trace.SpanKind.CLIENT
     ) as span:
         if span.is_recording():
-            span.set_attribute(SpanAttributes.DB_STATEMENT, resource)
-            _set_connection_attributes(span, instance)
-            span.set_attribute(
-                "db.redis.pipeline_length", len(instance.command_stack)
+            attributes = _extract_conn_attributes(
+                instance.connection_pool.connection_kwargs
+            )
+            attributes[SpanAttributes.DB_STATEMENT] = resource
+            attributes["db.redis.pipeline_length"] = len(
+                instance.command_stack
             )
+            span.set_attributes(attributes)
         return func(*args, **kwargs)
 
 
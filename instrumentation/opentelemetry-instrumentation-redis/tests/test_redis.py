@@ -16,6 +16,7 @@ from unittest import mock
 import redis
 
 from opentelemetry.instrumentation.redis import RedisInstrumentor
+from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import SpanKind
 
@@ -33,6 +34,10 @@ class TestRedis(TestBase):
         span = spans[0]
         self.assertEqual(span.name, "GET")
         self.assertEqual(span.kind, SpanKind.CLIENT)
+        self.assertEqual(
+            span.attributes[SpanAttributes.DB_STATEMENT], "GET key"
+        )
+        self.assertEqual(span.attributes["db.redis.args_length"], 2)
 
     def test_not_recording(self):
         redis_client = redis.Redis()
@@ -49,6 +54,7 @@ class TestRedis(TestBase):
                 self.assertFalse(mock_span.is_recording())
                 self.assertTrue(mock_span.is_recording.called)
                 self.assertFalse(mock_span.set_attribute.called)
+                self.assertFalse(mock_span.set_attributes.called)
                 self.assertFalse(mock_span.set_status.called)
 
     def test_instrument_uninstrument(self):
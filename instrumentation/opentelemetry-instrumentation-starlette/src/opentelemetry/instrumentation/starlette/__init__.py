@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from starlette import applications
-from starlette.routing import Match
+from starlette.routing import Match, Mount, Route, WebSocketRoute
 
 from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
@@ -22,6 +22,14 @@ from opentelemetry.util.http import get_excluded_urls
 
 _excluded_urls = get_excluded_urls("STARLETTE")
 
+# Bound on the number of (type, method, path) entries memoized per
+# application, since paths with parameters can take any number of values.
+_ROUTE_CACHE_MAXSIZE = 1024
+
+# Route types whose matches() only depends on the scope type, method and
+# path. Subclasses may override matches(), so the types are compared exactly.
+_CACHEABLE_ROUTE_TYPES = (Route, WebSocketRoute, Mount)
+
 
 class StarletteInstrumentor(BaseInstrumentor):
     """An instrumentor for starlette
@@ -74,15 +82,7 @@ def _get_route_details(scope):
 
     See: https://github.com/encode/starlette/pull/804
     """
-    app = scope["app"]
-    route = None
-    for starlette_route in app.routes:
-        match, _ = starlette_route.matches(scope)
-        if match == Match.FULL:
-            route = starlette_route.path
-            break
-        if match == Match.PARTIAL:
-            route = starlette_route.path
+    route = _get_route(scope)
     # method only exists for http, if websocket
     # leave it blank.
     span_name = route or scope.get("method", "")
@@ -90,3 +90,52 @@ def _get_route_details(scope):
     if route:
         attributes[SpanAttributes.HTTP_ROUTE] = route
     return span_name, attributes
+
+
+def _get_route(scope):
+    """Returns the path of the route serving scope, if any.
+
+    When all routes are plain ``Route``, ``WebSocketRoute`` or ``Mount``
+    instances, matching only depends on the scope type, method and path, so
+    the result of scanning the routes is memoized on the application. The
+    cache is reset whenever the routes change.
+    """
+    app = scope["app"]
+    routes = app.routes
+    route_cache = getattr(app, "_otel_route_cache", None)
+    if route_cache is None or route_cache[0] != routes:
+        if all(type(route) in _CACHEABLE_ROUTE_TYPES for route in routes):
+            route_cache = (list(routes), {})
+        else:
+            route_cache = (list(routes), None)
+        # pylint: disable=protected-access
+        app._otel_route_cache = route_cache
+
+    cache = route_cache[1]
+    if cache is None:
+        return _match_route(routes, scope)
+
+    key = (scope["type"], scope.get("method"), scope["path"])
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    route = _match_route(routes, scope)
+    if len(cache) >= _ROUTE_CACHE_MAXSIZE:
+        cache.clear()
+    cache[key] = route
+    return route
+
+
+def _match_route(routes, scope):
+    route = None
+    for starlette_route in routes:
+        match, _ = starlette_route.matches(scope)
+        # Match members are singletons; identity skips IntEnum.__eq__
+        if match is Match.FULL:
+            route = starlette_route.path
+            break
+        if match is Match.PARTIAL:
+            route = starlette_route.path
+    return route
@@ -17,7 +17,7 @@ from unittest.mock import patch
 
 from starlette import applications
 from starlette.responses import PlainTextResponse
-from starlette.routing import Route
+from starlette.routing import Match, Route
 from starlette.testclient import TestClient
 
 import opentelemetry.instrumentation.starlette as otel_starlette
@@ -83,6 +83,54 @@ class TestStarletteManualInstrumentation(TestBase):
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
 
+    def test_starlette_route_added_after_first_request(self):
+        """Ensure that memoized routes are refreshed when routes change."""
+        self._client.get("/added")
+        self.memory_exporter.clear()
+        self._app.add_route("/added", lambda _: PlainTextResponse("hi"))
+        self._client.get("/added")
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 3)
+        self.assertEqual(
+            spans[-1].attributes[SpanAttributes.HTTP_ROUTE], "/added"
+        )
+
+    def test_starlette_route_replaced_in_place(self):
+        """Ensure that memoized routes are refreshed when a route is
+        replaced without changing the number of routes."""
+        self._client.get("/foobar")
+        self.memory_exporter.clear()
+        self._app.routes[0] = Route("/{name}", lambda _: PlainTextResponse(""))
+        self._client.get("/foobar")
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            spans[-1].attributes[SpanAttributes.HTTP_ROUTE], "/{name}"
+        )
+
+    def test_starlette_custom_route_not_memoized(self):
+        """Ensure that routes matching on more than the path are not
+        memoized."""
+
+        class HeaderRoute(Route):
+            def matches(self, scope):
+                if dict(scope["headers"]).get(b"x-route") != b"custom":
+                    return Match.NONE, {}
+                return super().matches(scope)
+
+        self._app.routes.insert(
+            0, HeaderRoute("/{name}", lambda _: PlainTextResponse("hi"))
+        )
+        self._client.get("/foobar", headers={"x-route": "custom"})
+        self._client.get("/foobar")
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 6)
+        self.assertEqual(
+            spans[2].attributes[SpanAttributes.HTTP_ROUTE], "/{name}"
+        )
+        self.assertEqual(
+            spans[5].attributes[SpanAttributes.HTTP_ROUTE], "/foobar"
+        )
+
     @staticmethod
     def _create_starlette_app():
         def home(_):
@@ -69,6 +69,11 @@ from opentelemetry.trace.status import Status, StatusCode
 _HTTP_VERSION_PREFIX = "HTTP/"
 _CARRIER_KEY_PREFIX = "HTTP_"
 _CARRIER_KEY_PREFIX_LEN = len(_CARRIER_KEY_PREFIX)
+# Maps header names to their environ keys. Propagators look up the same
+# few headers on every request; the bound only guards against callers
+# passing arbitrary names.
+_ENVIRON_KEYS = {}
+_ENVIRON_KEYS_MAXSIZE = 256
 
 
 class WSGIGetter(Getter):
@@ -85,17 +90,22 @@ class WSGIGetter(Getter):
              A list with a single string with the header value if it exists,
              else None.
         """
-        environ_key = "HTTP_" + key.upper().replace("-", "_")
+        environ_key = _ENVIRON_KEYS.get(key)
+        if environ_key is None:
+            environ_key = _CARRIER_KEY_PREFIX + key.upper().replace("-", "_")
+            if len(_ENVIRON_KEYS) < _ENVIRON_KEYS_MAXSIZE:
+                _ENVIRON_KEYS[key] = environ_key
         value = carrier.get(environ_key)
         if value is not None:
             return [value]
         return None
 
     def keys(self, carrier):
+        # comparing a slice avoids a method call per environ key
         return [
             key[_CARRIER_KEY_PREFIX_LEN:].lower().replace("_", "-")
             for key in carrier
-            if key.startswith(_CARRIER_KEY_PREFIX)
+            if key[:_CARRIER_KEY_PREFIX_LEN] == _CARRIER_KEY_PREFIX
         ]
 
 
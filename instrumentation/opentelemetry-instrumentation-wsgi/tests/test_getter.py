@@ -32,6 +32,14 @@ class TestGetter(TestCase):
 
         self.assertEqual(val, ["val"])
 
+    def test_get_mixed_case(self):
+        getter = WSGIGetter()
+        carrier = {"HTTP_TEST_KEY": "val"}
+
+        self.assertEqual(getter.get(carrier, "Test-Key"), ["val"])
+        self.assertEqual(getter.get(carrier, "test-key"), ["val"])
+        self.assertEqual(getter.get(carrier, "Test-Key"), ["val"])
+
     def test_keys(self):
         getter = WSGIGetter()
         keys = getter.keys(
@@ -39,6 +47,7 @@ class TestGetter(TestCase):
                 "HTTP_TEST_KEY": "val",
                 "HTTP_OTHER_KEY": 42,
                 "NON_HTTP_KEY": "val",
+                "HTTP": "val",
             }
         )
 
@@ -81,4 +81,4 @@ class AwsXRayIdGenerator(IdGenerator):
     def generate_trace_id() -> int:
         trace_time = int(time.time())
         trace_identifier = random.getrandbits(96)
-        return (trace_time << 96) + trace_identifier
+        return (trace_time << 96) | trace_identifier
@@ -31,12 +31,12 @@ class AwsXRayIdGeneratorTest(unittest.TestCase):
 
     def test_id_timestamps_are_acceptable_for_xray(self):
         id_generator = AwsXRayIdGenerator()
+        one_month_ago_time = int(
+            (datetime.datetime.now() - datetime.timedelta(30)).timestamp()
+        )
         for _ in range(1000):
             trace_id = id_generator.generate_trace_id()
             trace_id_time = trace_id >> 96
             current_time = int(time.time())
             self.assertLessEqual(trace_id_time, current_time)
-            one_month_ago_time = int(
-                (datetime.datetime.now() - datetime.timedelta(30)).timestamp()
-            )
             self.assertGreater(trace_id_time, one_month_ago_time)
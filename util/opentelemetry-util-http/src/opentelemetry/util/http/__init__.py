@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 from os import environ
 from re import compile as re_compile
-from re import search
 
 
 class ExcludeList:
@@ -22,11 +22,14 @@ class ExcludeList:
 
     def __init__(self, excluded_urls):
         self._excluded_urls = excluded_urls
+        self._search = None
         if self._excluded_urls:
-            self._regex = re_compile("|".join(excluded_urls))
+            # a single alternation is matched in one pass over the url,
+            # and binding its search method skips the re module cache lookup
+            self._search = re_compile("|".join(excluded_urls)).search
 
     def url_disabled(self, url: str) -> bool:
-        return bool(self._excluded_urls and search(self._regex, url))
+        return self._search is not None and self._search(url) is not None
 
 
 _root = r"OTEL_PYTHON_{}"
@@ -48,12 +51,24 @@ def get_traced_request_attrs(instrumentation):
 
 def get_excluded_urls(instrumentation):
     excluded_urls = environ.get(
-        _root.format("{}_EXCLUDED_URLS".format(instrumentation)), []
+        _root.format("{}_EXCLUDED_URLS".format(instrumentation)), ""
     )
 
+    return parse_excluded_urls(excluded_urls)
+
+
+@lru_cache(maxsize=None)
+def parse_excluded_urls(excluded_urls):
+    """Returns an ExcludeList for a comma separated string of url regexes.
+
+    The result is cached by the string value, so instrumenting several
+    applications with the same configuration compiles the regex once.
+    """
     if excluded_urls:
         excluded_urls = [
             excluded_url.strip() for excluded_url in excluded_urls.split(",")
         ]
+    else:
+        excluded_urls = []
 
     return ExcludeList(excluded_urls)